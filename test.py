@@ -1,5 +1,8 @@
 from utils import NameLog, CodeMemo, StopWatch, iprint, Tagger
 from time import sleep
+from pathlib import Path
+from copy import deepcopy
+import os
 
 
 def main():
@@ -26,17 +29,20 @@ def main():
     log2 = NameLog()
     log1.track("test1", "test2")
     log2.track("accuracy")
+    log2.track("loss", dtype="d")
     test1 = 4
 
     def baz(log1, log2):
         test2 = 42
         log1.record()
         for accuracy in range(10):
+            loss = 1 / (accuracy + 1)
             log2.record()
 
     baz(log1, log2)
     print(log1.tracked)
     print(log2.tracked)
+    assert list(log2.get("loss")) == [1 / (i + 1) for i in range(10)]
 
     @CodeMemo
     def longjob(t, ret):
@@ -52,9 +58,17 @@ def main():
     res = worker()
     watch.stop()
     iprint(f"Got {res}")
-    iprint(f"Elapsed {watch.elapsed()}")
-
-    exit()
+    iprint(f"Elapsed {watch.elapsed()} ({watch.elapsed_ns():,} ns)")
+
+    # memos of a forked child are saved too, even if the parent already started the writer
+    pid = os.fork()
+    if pid == 0:
+        longjob(0, ret="forked")
+        raise SystemExit
+    os.waitpid(pid, 0)
+    saved = [f.name for f in Path("saved").iterdir()]
+    assert any(name.endswith("-longjob-0-ret=forked") for name in saved)
+    print("Forked memo saved.")
 
     tagger = Tagger()
     print("Basic")
@@ -75,6 +89,18 @@ def main():
 
     print()
 
+    tagger = Tagger()
+    twin = deepcopy(tagger)
+    # long enough to wrap around both word lists
+    n = max(tagger.nnouns, tagger.nadjs) + 10
+    for k in (3, n, n):
+        assert tagger.make_many(k) == [twin.make() for _ in range(k)]
+        assert tagger.counter_nouns == twin.counter_nouns
+        assert tagger.counter_adjectives == twin.counter_adjectives
+    print("make_many matches make.")
+
+    print()
+
     tagger = Tagger(10)
     print("Numeric 10")
     print(f"# possible tags: {tagger.size():,}")
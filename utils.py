@@ -1,18 +1,24 @@
+import atexit
 import os
 import pickle
+import queue
 import signal
-from collections import defaultdict
+import sys
+import threading
+from array import array
+from collections import OrderedDict
 from datetime import timedelta
+from functools import lru_cache
 from hashlib import md5
-from inspect import currentframe, getouterframes, stack
+from itertools import chain, islice
 from pathlib import Path
 from pprint import pformat
-from random import choice, shuffle
+from random import choices, randrange, shuffle
 from string import ascii_lowercase
-from time import time
+from time import monotonic, perf_counter_ns
 
 
-def search_scopes(name):
+def search_scopes(name, frame=None):
     """
     Search name in current and outer frames.
 
@@ -20,13 +26,16 @@ def search_scopes(name):
     ----------
     name : str
         variable name
+    frame : frame or None
+        frame to start the search from, defaults to the caller's frame.
 
     Returns
     -------
     str or None
         value of the variable "name", None if not found.
     """
-    frame = currentframe()
+    if frame is None:
+        frame = sys._getframe(1)
     while name not in frame.f_locals:
         frame = frame.f_back
         if frame is None:
@@ -34,6 +43,71 @@ def search_scopes(name):
     return frame.f_locals[name]
 
 
+def _lookup_names(names, frame):
+    """
+    Search several names in frame and its outer frames, inner frames first.
+    The walk stops as soon as all names are found.
+
+    Parameters
+    ----------
+    names : iterable of str
+        variable names
+    frame : frame
+        innermost frame to search
+
+    Returns
+    -------
+    dict
+        values of the names that were found.
+    """
+    found = {}
+    missing = set(names)
+    while missing and frame is not None:
+        scope = frame.f_locals
+        # f_locals may be a FrameLocalsProxy (3.13+), only rely on membership tests
+        hits = [name for name in missing if name in scope]
+        for name in hits:
+            found[name] = scope[name]
+        missing.difference_update(hits)
+        frame = frame.f_back
+    return found
+
+
+def _outermost_frame():
+    """
+    Walk the frames outward from the caller and return the outermost one.
+
+    Cheaper than ``inspect.getouterframes`` since no source file is read.
+    """
+    f = sys._getframe(1)
+    while f.f_back is not None:
+        f = f.f_back
+    return f
+
+
+def _call_stack_names(frame, skip_outer):
+    """
+    Collect the function names on the call stack, outermost first.
+
+    Parameters
+    ----------
+    frame : frame
+        innermost frame to include
+    skip_outer : int
+        number of outermost frames to drop
+
+    Returns
+    -------
+    list
+        names of the functions on the call stack
+    """
+    names = []
+    while frame is not None:
+        names.append(frame.f_code.co_name)
+        frame = frame.f_back
+    return names[: len(names) - skip_outer][::-1]
+
+
 def folder_size(folder):
     """
     Calculates size of folder in MegaBytes
@@ -48,9 +122,188 @@ def folder_size(folder):
     float
         Folder size in MegaBytes
     """
-    files = [f for f in Path(folder).glob("**/*") if f.is_file()]
+    # scandir entries cache the stat info, avoids building a Path per file
+    total = 0
+    folders = [folder]
+    while folders:
+        try:
+            entries = os.scandir(folders.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    # files can be deleted while we walk (e.g. CodeMemo evictions)
+                    try:
+                        total += entry.stat(follow_symlinks=False).st_size
+                    except FileNotFoundError:
+                        pass
     # divide by 1e6 to get megabytes
-    return sum(os.path.getsize(file) for file in files) / 1e6
+    return total / 1e6
+
+
+@lru_cache(maxsize=None)
+def _hash_prefix(filename, lineno, mtime_ns):
+    """
+    Hash the code of filename up to lineno, ignoring imports and formatting.
+    mtime_ns is only part of the cache key, so that edited files are hashed again.
+    """
+    lines = Path(filename).read_bytes().split(b"\n", lineno)[:lineno]
+    h = md5()
+    for line in lines:
+        # ignore spaces, empylines and imports (checked once spaces are gone, e.g. "imp ort")
+        line = line.strip().translate(None, b" ")
+        if b"import" not in line:
+            h.update(line)
+    return h.hexdigest()
+
+
+# memos waiting for the background writer, path -> pickled bytes
+_PENDING = {}
+_PENDING_LOCK = threading.Lock()
+_WRITE_Q = queue.Queue()
+_WRITER = None
+
+
+def _write_memos():
+    """
+    Background writer: move queued memos to disk, skipping those evicted in the meantime.
+    """
+    while True:
+        ledger, loc, data = _WRITE_Q.get()
+        tmp = None
+        try:
+            # the folder might have been removed since the memo was queued
+            ledger.folder.mkdir(exist_ok=True, parents=True)
+            # write to a temporary file and rename it so readers never see a partial pickle
+            # 0o666 minus the current umask, the same mode open(loc, "wb") would give
+            name = f".{loc.name}.{os.getpid()}.{threading.get_ident()}"
+            fd = os.open(loc.parent / name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            tmp = loc.parent / name
+            with open(fd, "wb") as f:
+                f.write(data)
+            with _PENDING_LOCK:
+                if _PENDING.get(loc) is data:
+                    os.replace(tmp, loc)
+                    tmp = None
+                    del _PENDING[loc]
+        except Exception as e:
+            # keep the writer alive, the memo is just not saved
+            msg = f"CodeMemo: could not save {loc}: {e}"
+            print(color(msg, "warn"), file=sys.stderr)
+            with _PENDING_LOCK:
+                if _PENDING.get(loc) is data:
+                    del _PENDING[loc]
+            with _LEDGERS_LOCK:
+                if loc in ledger.entries:
+                    ledger.bytes -= ledger.entries.pop(loc)
+        finally:
+            # the memo was evicted meanwhile or the write failed, don't leak the temporary file
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+            _WRITE_Q.task_done()
+
+
+def _save_later(ledger, loc, data):
+    """
+    Queue data to be written to loc by the background writer, ledger tracks the folder size.
+    """
+    global _WRITER
+    with _PENDING_LOCK:
+        _PENDING[loc] = data
+        if _WRITER is None or not _WRITER.is_alive():
+            _WRITER = threading.Thread(
+                target=_write_memos,
+                name="codememo-writer",
+                daemon=True,
+            )
+            _WRITER.start()
+    _WRITE_Q.put((ledger, loc, data))
+
+
+def _drain_writes(timeout=60):
+    """
+    Wait for the queued memos to reach the disk, giving up after timeout seconds.
+    """
+    deadline = monotonic() + timeout
+    with _WRITE_Q.all_tasks_done:
+        while _WRITE_Q.unfinished_tasks:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                msg = (
+                    f"CodeMemo: gave up waiting for {_WRITE_Q.unfinished_tasks} "
+                    "memos to be saved"
+                )
+                print(color(msg, "warn"), file=sys.stderr)
+                return
+            _WRITE_Q.all_tasks_done.wait(remaining)
+
+
+def _reset_after_fork():
+    """
+    A forked child gets a copy of the writer state but not the writer thread, start afresh.
+    The parent's queued memos are still written by the parent.
+    """
+    global _PENDING, _PENDING_LOCK, _WRITE_Q, _WRITER, _LEDGERS_LOCK
+    _PENDING = {}
+    _PENDING_LOCK = threading.Lock()
+    _WRITE_Q = queue.Queue()
+    _WRITER = None
+    _LEDGERS_LOCK = threading.Lock()
+
+
+# don't lose queued memos when the script ends
+atexit.register(_drain_writes)
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _Ledger:
+    """
+    Size bookkeeping of a memo folder, shared by all the CodeMemo instances saving there.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.rescan()
+
+    def rescan(self):
+        # the folder might have been removed since the last scan
+        self.folder.mkdir(exist_ok=True, parents=True)
+        # keep track of the memos, oldest first, to avoid rescanning the folder on every call
+        # dotfiles are temporary files of writes in progress
+        files = sorted(
+            [
+                f
+                for f in self.folder.iterdir()
+                if f.is_file() and not f.name.startswith(".")
+            ],
+            key=os.path.getmtime,
+        )
+        self.entries = OrderedDict((f, f.stat().st_size) for f in files)
+        with _PENDING_LOCK:
+            for loc, data in _PENDING.items():
+                if loc.parent == self.folder:
+                    self.entries[loc] = len(data)
+        self.bytes = sum(self.entries.values())
+
+
+# resolved save folder -> _Ledger, the lock also guards every ledger's bookkeeping
+_LEDGERS = {}
+_LEDGERS_LOCK = threading.Lock()
+
+
+def _get_ledger(folder):
+    """
+    Return the ledger of folder, creating it on first use.
+    """
+    folder = folder.resolve()
+    with _LEDGERS_LOCK:
+        ledger = _LEDGERS.get(folder)
+        if ledger is None:
+            ledger = _LEDGERS[folder] = _Ledger(folder)
+        return ledger
 
 
 class CodeMemo:
@@ -74,17 +327,15 @@ class CodeMemo:
         self.save_folder = Path("./saved")
         self.save_folder.mkdir(exist_ok=True, parents=True)
         self.threshold = threshold  # Megabytes
+        # the threshold applies to the whole folder, so the size is tracked per folder, not per function
+        self._ledger = _get_ledger(self.save_folder)
 
     def state(self):
         # Get the outermost caller
-        info = getouterframes(currentframe())[-1]
-        with open(info.filename, "r") as f:
-            # ignore spaces and empylines
-            code = [next(f).strip().replace(" ", "") for _ in range(info.lineno)]
-        # ignore imports
-        prev_code = "".join([line for line in code if "import" not in line])
-        state_hash = md5(prev_code.encode("utf-8")).hexdigest()
-        return state_hash
+        info = _outermost_frame()
+        filename = info.f_code.co_filename
+        # the hash only changes if the file is edited, skip re-reading it otherwise
+        return _hash_prefix(filename, info.f_lineno, os.stat(filename).st_mtime_ns)
 
     def __call__(self, *args, **kwargs):
         s = self.state()
@@ -93,24 +344,44 @@ class CodeMemo:
             s += "-" + "-".join([f"{arg}" for arg in args])
         if len(kwargs) > 0:
             s += "-" + "-".join([f"{key}={val}" for key, val in kwargs.items()])
-        loc = self.save_folder / s
-
-        if folder_size(self.save_folder) > self.threshold:
-            # remove oldest
-            paths = sorted(
-                [f for f in self.save_folder.iterdir() if f.is_file()],
-                key=os.path.getmtime,
-            )
-            if len(paths) > 0:
-                paths[0].unlink()
-
-        if loc.exists():
-            with open(loc, "rb") as f:
-                ret = pickle.load(f)
-        else:
-            ret = self.fn(*args, **kwargs)
-            with open(loc, "wb") as f:
-                pickle.dump(ret, f)
+        ledger = self._ledger
+        loc = ledger.folder / s
+
+        with _LEDGERS_LOCK:
+            while ledger.bytes > self.threshold * 1e6 and len(ledger.entries) > 0:
+                # remove oldest until back under the threshold
+                oldest, size = ledger.entries.popitem(last=False)
+                ledger.bytes -= size
+                with _PENDING_LOCK:
+                    # a memo still queued for writing is simply dropped
+                    pending = _PENDING.pop(oldest, None) is not None
+                    try:
+                        oldest.unlink()
+                        missing = False
+                    except FileNotFoundError:
+                        missing = not pending
+                if missing:
+                    # the folder was changed behind our back, the counter can't be trusted
+                    ledger.rescan()
+
+        with _PENDING_LOCK:
+            data = _PENDING.get(loc)
+        if data is None:
+            try:
+                data = loc.read_bytes()
+            except FileNotFoundError:
+                pass
+        if data is not None:
+            return pickle.loads(data)
+
+        ret = self.fn(*args, **kwargs)
+        # serialize now, the write itself happens in the background
+        data = pickle.dumps(ret, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(data)
+        with _LEDGERS_LOCK:
+            ledger.bytes += size - ledger.entries.pop(loc, 0)
+            ledger.entries[loc] = size
+            _save_later(ledger, loc, data)
         return ret
 
 
@@ -123,21 +394,37 @@ class NameLog:
         self.names = []
         self.tracked = {}
 
-    def track(self, *names):
+    def track(self, *names, dtype=None):
         """
         Adds names to list of tracked variables.
+
+        Parameters
+        ----------
+
+        dtype : str or None
+            ``array`` typecode (e.g. "d" for floats, "q" for ints) used to store
+            numeric values compactly. Values are converted to the typecode, with "d"
+            a recorded 1 is stored as 1.0. The first value that doesn't fit replaces the
+            array with a list holding the values so far, so references previously
+            returned by get stop updating.
         """
         for name in names:
             self.names.append(name)
-            self.tracked[name] = []
+            self.tracked[name] = [] if dtype is None else array(dtype)
 
     def record(self):
         """
         Inspects current and calling frames to record the value of tracked variables.
         """
+        # walk the calling frames once for all names
+        values = _lookup_names(self.names, sys._getframe(1))
         for name in self.names:
-            val = search_scopes(name)
-            self.tracked[name].append(val)
+            val = values.get(name)
+            try:
+                self.tracked[name].append(val)
+            except (TypeError, OverflowError):
+                # not numeric, switch to a regular list (a new object, see track)
+                self.tracked[name] = list(self.tracked[name]) + [val]
 
     def get(self, name):
         """
@@ -152,8 +439,9 @@ class NameLog:
 
         Returns
         -------
-        list
-            List of recorded values.
+        list or array.array
+            Recorded values, an ``array.array`` if name was tracked with a dtype and all
+            values fit it. The container is replaced when it falls back to a list.
         """
         if name in self.tracked:
             return self.tracked[name]
@@ -173,7 +461,7 @@ class StopWatch:
         """Start the stopwatch and raises an error if already running."""
         if not self.running:
             self.running = True
-            self._start = time()
+            self._start = perf_counter_ns()
         else:
             raise RuntimeError("Stopwatch already running!")
 
@@ -181,7 +469,7 @@ class StopWatch:
         """Stops the stopwatch and raises an error if it hadn't been started."""
         if self.running:
             self.running = False
-            self._stop = time()
+            self._stop = perf_counter_ns()
         else:
             raise RuntimeError("Stopwatch not started yet!")
 
@@ -194,19 +482,47 @@ class StopWatch:
         str
             the elapsed time.
         """
-        return str(timedelta(seconds=self._stop - self._start))
+        return str(timedelta(microseconds=self.elapsed_ns() // 1000))
 
+    def elapsed_ns(self):
+        """
+        Return elapsed time in nanoseconds.
+
+        Returns
+        -------
+        int
+            the elapsed time.
+        """
+        return self._stop - self._start
+
+
+HEADER = "\033[95m"
+OKBLUE = "\033[94m"
+OKCYAN = "\033[96m"
+OKGREEN = "\033[92m"
+WARNING = "\033[93m"
+FAIL = "\033[91m"
+ENDC = "\033[0m"
+BOLD = "\033[1m"
+UNDERLINE = "\033[4m"
 
 colors = {
-    "HEADER": "\033[95m",
-    "OKBLUE": "\033[94m",
-    "OKCYAN": "\033[96m",
-    "OKGREEN": "\033[92m",
-    "WARNING": "\033[93m",
-    "FAIL": "\033[91m",
-    "ENDC": "\033[0m",
-    "BOLD": "\033[1m",
-    "UNDERLINE": "\033[4m",
+    "HEADER": HEADER,
+    "OKBLUE": OKBLUE,
+    "OKCYAN": OKCYAN,
+    "OKGREEN": OKGREEN,
+    "WARNING": WARNING,
+    "FAIL": FAIL,
+    "ENDC": ENDC,
+    "BOLD": BOLD,
+    "UNDERLINE": UNDERLINE,
+}
+
+# (prefix, suffix) wrapping the text for each color accepted by color()
+_COLOR_WRAP = {
+    "red": (FAIL, ENDC),
+    "green": (OKGREEN, ENDC),
+    "warn": (WARNING + BOLD, ENDC),
 }
 
 
@@ -218,7 +534,7 @@ def flatten(l):
 
     e.g. [[1,2,3],[a,b,c]] becomes [1,2,3,a,b,c]
     """
-    return [a for b in l for a in b]
+    return list(chain.from_iterable(l))
 
 
 def unzip(l):
@@ -229,7 +545,7 @@ def unzip(l):
 
     e.g. [[1,2,3],[a,b,c]] becomes [[1,a], [2,b], [3,c]]
     """
-    return list(zip(*l))
+    return [list(t) for t in zip(*l)]
 
 
 def color(text, c):
@@ -249,55 +565,91 @@ def color(text, c):
     str
         Colored version of the desired text
     """
-    if c == "red":
-        return f"{colors['FAIL']}{text}{colors['ENDC']}"
-    elif c == "green":
-        return f"{colors['OKGREEN']}{text}{colors['ENDC']}"
-    elif c == "warn":
-        return f"{colors['WARNING']+colors['BOLD']}{text}{colors['ENDC']}"
-    else:
+    wrap = _COLOR_WRAP.get(c)
+    if wrap is None:
         return text
+    return f"{wrap[0]}{text}{wrap[1]}"
+
+
+# walking the call stack is the most expensive part of iprint, keep it opt-in
+_SHOW_STACK = os.environ.get("PROTOUTILS_IPRINT_STACK", "0") == "1"
+
+# colored "[lineno call/stack]: " header, only the line number and stack vary
+_LINEINFO = color("[", "green") + color("%d", "warn") + color("%s]: ", "green")
+
+
+def _fmt_plain(arg, smart, cols):
+    return str(arg)
+
+
+def _fmt_list(arg, smart, cols):
+    # Print only some elements of lists to avoid flooding the screen
+    if len(arg) > smart:
+        els = ", ".join([str(el) for el in arg[:smart]])
+        return f"[{els}, ... ]({len(arg)})"
+    return str(arg)
+
+
+def _fmt_dict(arg, smart, cols):
+    return pformat(arg, depth=1, width=cols)
+
+
+@lru_cache(maxsize=256)
+def _iprint_formatters(types, smart):
+    """
+    Pick the formatter of each iprint argument, call sites tend to repeat the same types.
+    Returns the formatters and whether the terminal width is needed.
+    """
+    formatters = []
+    for t in types:
+        if smart > 0 and issubclass(t, list):
+            formatters.append(_fmt_list)
+        elif smart > 0 and issubclass(t, dict):
+            formatters.append(_fmt_dict)
+        else:
+            formatters.append(_fmt_plain)
+    return tuple(formatters), _fmt_dict in formatters
 
 
 def iprint(*args, smart=5):
     """
     Enhance prints in scripts with line info and caller stack.
     Lists are truncated and dictionaries are formatted with pretty-print.
+    The caller stack is only shown when the PROTOUTILS_IPRINT_STACK environment variable is set to 1.
     """
 
-    call_frames = getouterframes(currentframe())
-    call_stack = "/".join([frame.function for frame in reversed(stack()[1:-1])])
-
-    lineinfo = (
-        color("[", "green")
-        # [0] would this very line, [1] is going to be the line in its script
-        + color(f"{call_frames[1].lineno}", "warn")
-        + color(f"{' '+call_stack if len(call_stack)>0 else ''}]: ", "green")
-    )
-    print(lineinfo, end="")
-
-    for arg in args:
-        # Print only some elements of lists and dictionaries to avoid flooding the screen
-        if smart > 0:
-            if type(arg) == list:
-                if len(arg) > smart:
-                    els = ", ".join([str(el) for el in arg[:smart]])
-                    print(f"[{els}, ... ]({len(arg)})", end=" ")
-            elif type(arg) == dict or type(arg) == defaultdict:
-                cols = os.get_terminal_size().columns
-                rep = pformat(arg, depth=1, width=cols)
-                print(rep, end=" ")
-            else:
-                print(arg, end=" ")
-        else:
-            print(arg, end=" ")
-    print()
+    # the frame of the iprint call in its script
+    caller = sys._getframe(1)
+    if _SHOW_STACK:
+        # drop the outermost <module>
+        names = _call_stack_names(caller, 1)
+        call_stack = " " + "/".join(names) if names else ""
+    else:
+        call_stack = ""
+
+    formatters, needs_width = _iprint_formatters(tuple(map(type, args)), smart)
+    # terminal width is only looked up if there is a dictionary to format
+    cols = os.get_terminal_size().columns if needs_width else None
+    body = "".join([f"{fmt(arg, smart, cols)} " for fmt, arg in zip(formatters, args)])
+    sys.stdout.write(_LINEINFO % (caller.f_lineno, call_stack) + body + "\n")
 
 
 def chunker(l, chunk_size):
     """
     Yield successive n-sized chunks from l.
+    bytes and memoryview inputs are chunked into memoryviews (no copies), use bytes(chunk) where
+    bytes methods are needed. bytearray is sliced as usual so it can still be resized.
+    Iterables without indexing are chunked into lists.
     """
+    if isinstance(l, (bytes, memoryview)):
+        l = memoryview(l)
+    elif not hasattr(l, "__getitem__"):
+        it = iter(l)
+        chunk = list(islice(it, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(it, chunk_size))
+        return
     for i in range(0, len(l), chunk_size):
         yield l[i : i + chunk_size]
 
@@ -324,6 +676,7 @@ class GracefulDeath:
     def __init__(self):
         self.alive = True
         self.stopped = False
+        self._sigint = 0
 
     def __enter__(self):
         # Register our modified handler for SIGINT (CTRL + C), and SIGTSTP (CTRL + Z)
@@ -332,16 +685,18 @@ class GracefulDeath:
         return self
 
     def handler(self, sig, frame):
+        # only set flags and use os.write, print takes the stdout lock and could deadlock here
         if sig == signal.SIGINT:  # CTRL + C
-            if self.alive:
-                print("Single SIGINT received: Attempting graceful shutdown")
-                self.alive = False
+            self._sigint += 1
+            self.alive = False
+            if self._sigint == 1:
+                os.write(2, b"Single SIGINT received: Attempting graceful shutdown\n")
             else:
-                print("Double SIGINT received: Terminating immediately.")
+                os.write(2, b"Double SIGINT received: Terminating immediately.\n")
                 self.old_handler1(sig, frame)
         if sig == signal.SIGTSTP:  # CTRL + Z
             self.stopped = True
-            print("SIGSTOP received")
+            os.write(2, b"SIGSTOP received\n")
 
     def __exit__(self, type, value, traceback):
         # Restore original handler
@@ -372,7 +727,23 @@ def id_generator(size=6, chars=ascii_lowercase):
     """
     Generated random lowercase string of length `size`
     """
-    return "".join(choice(chars) for _ in range(size))
+    return "".join(choices(chars, k=size))
+
+
+@lru_cache(maxsize=None)
+def _load_wordlist(name):
+    """
+    Read the words in a file local to the module, only once per process.
+    """
+    return tuple((here() / name).read_text().split())
+
+
+def _take_cycle(l, start, n):
+    """
+    Return n elements of l cycling from index start, using slices instead of per-element modulos.
+    """
+    rotated = l[start:] + l[:start]
+    return (rotated * (n // len(rotated) + 1))[:n]
 
 
 class Tagger:
@@ -381,10 +752,8 @@ class Tagger:
     It usese a adjective-noun{-random_id} structure.
     """
     def __init__(self, mode=None):
-        with open(here() / "nouns.txt", "r") as f:
-            self.nouns = f.read().rsplit()
-        with open(here() / "adjectives.txt", "r") as f:
-            self.adjectives = f.read().rsplit()
+        self.nouns = list(_load_wordlist("nouns.txt"))
+        self.adjectives = list(_load_wordlist("adjectives.txt"))
 
         shuffle(self.nouns)
         shuffle(self.adjectives)
@@ -395,29 +764,71 @@ class Tagger:
         self.counter_adjectives = 0
         self.mode = mode
         self.space = len(self.nouns) * len(self.adjectives)
-        if type(mode) == int:
+        # tags are built from pre-encoded words, "adj-" + "noun"
+        self._badjs = [f"{adj}-".encode("utf-8") for adj in self.adjectives]
+        self._bnouns = [noun.encode("utf-8") for noun in self.nouns]
+        # resolve the mode once instead of checking it on every make
+        if mode == None:
+            self._make_fn = Tagger._make_plain
+        elif type(mode) == int:
             assert mode > 0
             self.space *= mode
-        if type(mode) == str:
+            self._make_fn = Tagger._make_int
+        elif type(mode) == str:
             assert len(mode) > 0
             self.space *= len(ascii_lowercase) ** (len(mode))
+            self._make_fn = Tagger._make_str
+        else:
+            raise RuntimeError
 
     def size(self):
         return self.space
 
     def make(self):
-        noun = self.nouns[self.counter_nouns]
-        adj = self.adjectives[self.counter_adjectives]
+        """
+        Generate the next tag, using the version picked in __init__ for the mode.
+        """
+        return self._make_fn(self)
+
+    def _make_plain(self):
+        noun = self._bnouns[self.counter_nouns]
+        adj = self._badjs[self.counter_adjectives]
         # the number of nouns and adjectives is coprime to their difference
         self.counter_nouns = (self.counter_nouns + 1) % self.nnouns
         self.counter_adjectives = (self.counter_adjectives + 1) % self.nadjs
+        return adj + noun
+
+    def _make_int(self):
+        return b"%s-%d" % (self._make_plain(), randrange(self.mode))
+
+    def _make_str(self):
+        ID = id_generator(size=len(self.mode))
+        return b"%s-%s" % (self._make_plain(), ID.encode("utf-8"))
+
+    def make_many(self, n):
+        """
+        Generate n tags at once, in the same order as n calls to make.
+
+        Parameters
+        ----------
+
+        n : int
+            number of tags to generate.
+
+        Returns
+        -------
+        list
+            List of tags.
+        """
+        nouns = _take_cycle(self._bnouns, self.counter_nouns, n)
+        adjs = _take_cycle(self._badjs, self.counter_adjectives, n)
+        self.counter_nouns = (self.counter_nouns + n) % self.nnouns
+        self.counter_adjectives = (self.counter_adjectives + n) % self.nadjs
+        tags = [adj + noun for adj, noun in zip(adjs, nouns)]
         if self.mode == None:
-            return f"{adj}-{noun}".encode("utf-8")
+            return tags
         if type(self.mode) == int:
-            assert self.mode > 0
-            ID = choice(range(self.mode))
-            return f"{adj}-{noun}-{ID}".encode("utf-8")
-        if type(self.mode) == str:
-            ID = id_generator(size=len(self.mode))
-            return f"{adj}-{noun}-{ID}".encode("utf-8")
-        raise RuntimeError
+            IDs = choices(range(self.mode), k=n)
+            return [b"%s-%d" % (tag, ID) for tag, ID in zip(tags, IDs)]
+        IDs = [id_generator(size=len(self.mode)) for _ in range(n)]
+        return [b"%s-%s" % (tag, ID.encode("utf-8")) for tag, ID in zip(tags, IDs)]